@@ -77,8 +77,13 @@ __version__ = "1.0.0"
 
 # Convenience functions for C# project management
 def get_project_manager():
-    """Get a CSharpProjectManager instance"""
-    return csharp_project_manager.CSharpProjectManager()
+    """Get the shared (memoized) CSharpProjectManager instance."""
+    return csharp_project_manager.get_project_manager()
+
+
+def invalidate_project_manager():
+    """Drop the cached manager (e.g. after the active project changes)."""
+    csharp_project_manager.invalidate()
 
 
 def show_project_manager():
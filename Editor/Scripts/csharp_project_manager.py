@@ -11,10 +11,13 @@ C# Project Manager for O3DESharp
 Provides tools to create and manage C# scripting projects within O3DE.
 """
 
+import functools
 import os
 import json
 import re
+import string
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -22,6 +25,22 @@ import azlmbr.bus as bus
 import azlmbr.editor as editor
 import azlmbr.paths as paths
 
+# Optional C-accelerated JSON for the metadata read/write paths. orjson is
+# several times faster than stdlib json on both encode and decode; fall back
+# silently when it isn't installed (the editor's Python doesn't ship it).
+try:
+    import orjson
+
+    def _json_dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
+
 
 # Phase 16b helpers.
 
@@ -383,6 +402,192 @@ namespace {namespace}
 }}
 '''
 
+def _precompile_template(template: str):
+    """
+    Compile a str.format template into a specialized closure at import
+    time. The template is parsed once into literal segments and field
+    names, then emitted as a tiny lambda whose bytecode inlines the
+    literals and concatenates the field values directly - no format
+    mini-language interpreter runs on the create_project / create_script
+    path, and the renderer takes its fields as normal (keyword-friendly)
+    parameters. Our templates use bare ``{name}`` placeholders only;
+    format specs and conversions are not supported.
+    """
+    exprs = []    # repr'd literals interleaved with field identifiers
+    fields = []   # unique field names, in first-seen order
+    for literal, field_name, _spec, _conv in string.Formatter().parse(template):
+        if literal:
+            exprs.append(repr(literal))
+        if field_name is not None:
+            if not field_name.isidentifier():
+                raise ValueError(f"unsupported template placeholder: {field_name!r}")
+            exprs.append(field_name)
+            if field_name not in fields:
+                fields.append(field_name)
+
+    src = "lambda {}: {}".format(", ".join(fields), " + ".join(exprs) or "''")
+    return eval(compile(src, "<template>", "eval"), {})
+
+
+# Precompiled renderers for the fixed templates above.
+_RENDER_CSPROJ = _precompile_template(CSPROJ_TEMPLATE)
+
+
+# Precompiled patterns for C# source parsing. list_scripts runs these over
+# every .cs file in a project; compiling per call made the compile work O(N)
+# in file count for no reason. The base-class pattern depends on the class
+# name, so it's cached per unique name instead.
+_NAMESPACE_RE = re.compile(r'namespace\s+([\w.]+)')
+
+# How much of a .cs file list_scripts reads when parsing its header. The
+# namespace and primary class declaration always appear near the top; 4 KB
+# comfortably covers license headers + usings without slurping whole files.
+_SCRIPT_HEADER_READ_BYTES = 4096
+
+# Combined alternation so list_scripts extracts namespace AND base class in
+# one state-machine pass over the source instead of two full re.search scans.
+_HEADER_RE = re.compile(r'namespace\s+([\w.]+)|class\s+(\w+)\s*:\s*(\w+)')
+
+
+def _parse_script_header(content: str, class_name: str):
+    """
+    Extract (namespace, base_class) from C# source in a single scan.
+
+    Only the class declaration matching *class_name* (the file stem)
+    counts for the base class; nested helper classes in the same file are
+    skipped. Stops as soon as both pieces are found.
+    """
+    namespace = None
+    base_class = None
+    for match in _HEADER_RE.finditer(content):
+        if match.group(1):
+            if namespace is None:
+                namespace = match.group(1)
+        elif match.group(2) == class_name and base_class is None:
+            base_class = match.group(3)
+        if namespace is not None and base_class is not None:
+            break
+    return namespace, base_class
+
+
+@functools.lru_cache(maxsize=256)
+def _base_class_re(class_name: str) -> 're.Pattern':
+    """Compiled `class <name> : <base>` pattern, cached per class name."""
+    # re.escape so a class name containing regex metachars (shouldn't happen
+    # for valid C#, but file stems are user-controlled) can't break the parse.
+    return re.compile(rf'class\s+{re.escape(class_name)}\s*:\s*(\w+)')
+
+
+# Directory names pruned during .csproj discovery. Skipped at the directory
+# level so the walk never descends into build outputs in the first place -
+# rglob('*.csproj') + post-filter still pays readdir/stat for every file
+# under bin/ and obj/ of a built project.
+_CSPROJ_SKIP_DIRS = frozenset({"bin", "obj", ".git", "node_modules"})
+
+
+def _iter_csproj_files(root: Path):
+    """
+    Yield every .csproj under *root*, pruning build-output and hidden
+    directories before descending into them.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name in _CSPROJ_SKIP_DIRS or name.startswith("."):
+                            continue
+                        stack.append(Path(entry.path))
+                    elif name.endswith(".csproj"):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
+def _git_csproj_fast_path(root: Path) -> 'Optional[List[Path]]':
+    """
+    List .csproj files under *root* via ``git ls-files`` when it sits inside
+    a git checkout. The index scan is effectively an in-memory lookup,
+    skipping the per-directory readdir syscalls of a filesystem walk.
+    ``--others --exclude-standard`` keeps freshly created (untracked but
+    not ignored) projects visible. Returns None when git is unavailable or
+    *root* isn't in a repo, so callers fall back to the scandir walk.
+    """
+    try:
+        # core.quotepath=off keeps non-ASCII paths literal; with it on,
+        # git C-quotes them ("\303\251"-style) and the quoted string
+        # would be turned into a bogus Path below.
+        proc = subprocess.run(
+            ["git", "-C", str(root), "-c", "core.quotepath=off", "ls-files",
+             "--cached", "--others", "--exclude-standard", "--", "*.csproj"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+
+    paths = []
+    for line in proc.stdout.splitlines():
+        if not line:
+            continue
+        rel = Path(line)
+        # Same pruning rules as _iter_csproj_files, in case build outputs
+        # are tracked in an unusual repo.
+        if _CSPROJ_SKIP_DIRS.intersection(rel.parts):
+            continue
+        path = root / rel
+        # --cached also lists tracked files already deleted from the
+        # working tree; the walk can never return those, so keep parity
+        # at the cost of one stat per candidate (still far cheaper than
+        # walking).
+        if not path.exists():
+            continue
+        paths.append(path)
+    return paths
+
+
+def _parse_script_file(cs_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single .cs file header into the script-info dict list_scripts
+    returns, or None if the file can't be read. Free of shared mutable
+    state so list_scripts can fan it out across a thread pool.
+    """
+    try:
+        # Only the file header matters here - namespace and class
+        # declarations sit near the top - so read a bounded prefix
+        # instead of slurping the whole file. Keeps per-file I/O and
+        # decode work constant even for large generated scripts.
+        with cs_file.open('rb') as f:
+            content = f.read(_SCRIPT_HEADER_READ_BYTES).decode('utf-8', 'replace')
+    except Exception as e:
+        print(f"[O3DESharp] Error parsing {cs_file.name}: {e}")
+        return None
+
+    class_name = cs_file.stem
+    namespace, base_class = _parse_script_header(content, class_name)
+
+    return {
+        "file_name": cs_file.name,
+        "class_name": class_name,
+        "full_name": f"{namespace}.{class_name}" if namespace else class_name,
+        "namespace": namespace,
+        "base_class": base_class,
+        "is_script_component": base_class == "ScriptComponent",
+        "file_path": str(cs_file),  # Changed from 'path' to 'file_path' for consistency
+        "path": str(cs_file)  # Keep for backward compatibility
+    }
+
+
 class CSharpProjectManager:
     """Manages C# projects for O3DE scripting."""
     
@@ -393,16 +598,19 @@ class CSharpProjectManager:
     SCRIPT_TEMPLATES = {
         'ScriptComponent': {
             'template': SCRIPT_COMPONENT_TEMPLATE,
+            'render': _precompile_template(SCRIPT_COMPONENT_TEMPLATE),
             'description': 'A component script that can be attached to entities',
             'base_class': 'ScriptComponent'
         },
         'EmptyClass': {
             'template': EMPTY_CLASS_TEMPLATE,
+            'render': _precompile_template(EMPTY_CLASS_TEMPLATE),
             'description': 'An empty C# class',
             'base_class': None
         },
         'StaticClass': {
             'template': STATIC_CLASS_TEMPLATE,
+            'render': _precompile_template(STATIC_CLASS_TEMPLATE),
             'description': 'A static utility class',
             'base_class': None
         }
@@ -426,6 +634,24 @@ class CSharpProjectManager:
         # Cache for list_scripts results per project (project_path -> (timestamp, scripts))
         self._project_scripts_cache: Dict[str, tuple] = {}
         self._cache_ttl = 5.0  # Cache valid for 5 seconds
+
+        # Cache for list_projects, keyed by the search roots' mtimes so the
+        # recursive walk only reruns when a root actually changed. Also
+        # invalidated explicitly by create_project/create_script since a
+        # nested change doesn't bump the root directory's mtime.
+        self._projects_cache: Optional[List[Dict[str, Any]]] = None
+        self._projects_cache_key: Optional[tuple] = None
+
+        # Parsed project.json per project (keyed by metadata path) so batch
+        # script creation doesn't re-read + re-parse the file on every call
+        self._metadata_cache: Dict[str, dict] = {}
+
+        # (csproj path, mtime_ns) pairs that have built (and therefore
+        # restored) successfully this session - later builds of the same
+        # unchanged project can skip the NuGet restore pass entirely with
+        # --no-restore. Editing the csproj changes its mtime, so the next
+        # build misses here and restores again.
+        self._restored: set = set()
         
         # Automatically ensure runtime dependencies are deployed
         self._auto_deploy_runtime()
@@ -565,10 +791,19 @@ class CSharpProjectManager:
         return {}
     
     def _save_settings(self):
-        """Save settings to the project's settings file."""
+        """
+        Save settings to the project's settings file.
+
+        Written as compact JSON bytes - this file is only ever read back by
+        _load_settings, so indented formatting and the text-mode encoder
+        buy nothing. The user-facing .setreg emitted by
+        _update_settings_registry keeps its indent.
+        """
         settings_path = self._get_settings_path()
         try:
-            settings_path.write_text(json.dumps(self._settings, indent=2))
+            settings_path.write_bytes(
+                json.dumps(self._settings, separators=(",", ":")).encode("utf-8")
+            )
         except Exception as e:
             print(f"Failed to save O3DESharp settings: {e}")
     
@@ -633,20 +868,22 @@ class CSharpProjectManager:
         Returns:
             Dict with 'success' and 'message' keys
         """
-        path_obj = Path(path)
-        
-        if not path_obj.exists():
+        # Plain-string extension check first so the reject path never
+        # allocates a Path (these setters are called from UI handlers).
+        if not path.lower().endswith(".dll"):
             return {
                 "success": False,
-                "message": f"File does not exist: {path}"
+                "message": "File must be a .dll assembly"
             }
-        
-        if not path_obj.suffix.lower() == ".dll":
+
+        path_obj = Path(path)
+
+        if not path_obj.exists():
             return {
                 "success": False,
-                "message": "File must be a .dll assembly"
+                "message": f"File does not exist: {path}"
             }
-        
+
         self._settings["coral_managed_path"] = str(path_obj.resolve())
         self._save_settings()
         self.coral_managed_path = str(path_obj.resolve())
@@ -707,14 +944,16 @@ class CSharpProjectManager:
         Returns:
             Dict with 'success' and 'message' keys
         """
-        path_obj = Path(path)
-        
-        if not path_obj.suffix.lower() == ".dll":
+        # Plain-string extension check first so the reject path never
+        # allocates a Path.
+        if not path.lower().endswith(".dll"):
             return {
                 "success": False,
                 "message": "Path must end with .dll"
             }
-        
+
+        path_obj = Path(path)
+
         self._settings["user_assembly_path"] = str(path_obj)
         self._save_settings()
         self.user_assembly_path = str(path_obj)
@@ -794,6 +1033,32 @@ class CSharpProjectManager:
         except Exception as e:
             print(f"Failed to update settings registry: {e}")
     
+    # (dict key, file name) pairs for the files each component ships with.
+    # Shared by the deploy/check methods so the lists stay in sync.
+    _CORAL_FILE_KEYS = (
+        ("dll", "Coral.Managed.dll"),
+        ("runtimeconfig", "Coral.Managed.runtimeconfig.json"),
+        ("deps", "Coral.Managed.deps.json"),
+    )
+    _O3DE_CORE_FILE_KEYS = (
+        ("dll", "O3DE.Core.dll"),
+        ("deps", "O3DE.Core.deps.json"),
+    )
+
+    @staticmethod
+    def _list_dir_names(path: Path) -> frozenset:
+        """
+        Return the entry names of *path* from a single scandir, or an empty
+        frozenset if the directory can't be read. Lets callers answer "are
+        all these files present?" with set membership instead of one stat
+        syscall per file.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return frozenset(entry.name for entry in entries)
+        except OSError:
+            return frozenset()
+
     def get_coral_deploy_path(self) -> Path:
         """Get the path where Coral files should be deployed."""
         return self.project_path / "Bin" / "Scripts" / "Coral"
@@ -836,6 +1101,31 @@ class CSharpProjectManager:
 
         return best_path
 
+    # Relative search-path segments for _get_assembly_search_dirs, frozen at
+    # class level so each call joins them against the engine/gem root in one
+    # go instead of re-parsing a chain of `/` operations per call. This runs
+    # on every deploy-check (init + ensure_runtime_deployed), so the Path
+    # construction cost is amortized over the class lifetime.
+    #
+    # Gem-root-relative: staging folder + dotnet build outputs
+    # (all config x TFM combos).
+    _GEM_DIRECT_SUBPATHS = (
+        ("bin", "Coral"),
+        ("bin", "O3DE.Core"),
+        ("bin",),
+        ("Assets", "Scripts", "O3DE.Core", "bin", "Debug", "net9.0"),
+        ("Assets", "Scripts", "O3DE.Core", "bin", "Release", "net9.0"),
+        ("Assets", "Scripts", "O3DE.Core", "bin", "Debug", "net8.0"),
+        ("Assets", "Scripts", "O3DE.Core", "bin", "Release", "net8.0"),
+    )
+    # Engine-root-relative: install tree copies.
+    _ENGINE_DIRECT_SUBPATHS = (
+        ("install", "Gems", "O3DESharp", "Assets", "Scripts", "O3DE.Core", "bin", "Debug", "net9.0"),
+        ("install", "Gems", "O3DESharp", "Assets", "Scripts", "O3DE.Core", "bin", "Release", "net9.0"),
+        ("install", "Gems", "O3DESharp", "Assets", "Scripts", "O3DE.Core", "bin", "Debug", "net8.0"),
+        ("install", "Gems", "O3DESharp", "Assets", "Scripts", "O3DE.Core", "bin", "Release", "net8.0"),
+    )
+
     def _get_assembly_search_dirs(self):
         """
         Return (direct_dirs, rglob_roots) tuples for both Coral and O3DE.Core
@@ -849,22 +1139,8 @@ class CSharpProjectManager:
         # e.g. F:/o3de/workspace/bin/profile -> F:/o3de/workspace
         build_workspace = exe_folder.parent.parent if exe_folder.exists() else None
 
-        direct_dirs = [
-            # Gem staging (committed / CMake copy)
-            gem_root / "bin" / "Coral",
-            gem_root / "bin" / "O3DE.Core",
-            gem_root / "bin",
-            # dotnet build outputs (all config x TFM combos)
-            gem_root / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Debug" / "net9.0",
-            gem_root / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Release" / "net9.0",
-            gem_root / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Debug" / "net8.0",
-            gem_root / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Release" / "net8.0",
-            # Install tree copies
-            engine_root / "install" / "Gems" / "O3DESharp" / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Debug" / "net9.0",
-            engine_root / "install" / "Gems" / "O3DESharp" / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Release" / "net9.0",
-            engine_root / "install" / "Gems" / "O3DESharp" / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Debug" / "net8.0",
-            engine_root / "install" / "Gems" / "O3DESharp" / "Assets" / "Scripts" / "O3DE.Core" / "bin" / "Release" / "net8.0",
-        ]
+        direct_dirs = [gem_root.joinpath(*p) for p in self._GEM_DIRECT_SUBPATHS]
+        direct_dirs += [engine_root.joinpath(*p) for p in self._ENGINE_DIRECT_SUBPATHS]
 
         # User-configured Coral.Managed path directory
         if self.coral_managed_path:
@@ -943,14 +1219,13 @@ class CSharpProjectManager:
                     "deployed_files": []
                 }
             
-            # Build file list from provided path
-            source_files = {}
-            for key, filename in [("dll", "Coral.Managed.dll"), 
-                                   ("runtimeconfig", "Coral.Managed.runtimeconfig.json"),
-                                   ("deps", "Coral.Managed.deps.json")]:
-                file_path = source_dir / filename
-                if file_path.exists():
-                    source_files[key] = file_path
+            # Build file list from provided path (one scandir, no per-file stat)
+            present = self._list_dir_names(source_dir)
+            source_files = {
+                key: source_dir / filename
+                for key, filename in self._CORAL_FILE_KEYS
+                if filename in present
+            }
         else:
             source_files = self.find_coral_source_files()
         
@@ -997,10 +1272,10 @@ class CSharpProjectManager:
                     "deployed_files": deployed_files
                 }
         
-        # Check for missing optional files
-        expected_files = ["Coral.Managed.dll", "Coral.Managed.runtimeconfig.json", "Coral.Managed.deps.json"]
-        for filename in expected_files:
-            if not (deploy_path / filename).exists():
+        # Check for missing optional files (single scandir of the deploy dir)
+        deployed_names = self._list_dir_names(deploy_path)
+        for _, filename in self._CORAL_FILE_KEYS:
+            if filename not in deployed_names:
                 missing_files.append(filename)
         
         message = f"Successfully deployed {len(deployed_files)} file(s) to {deploy_path}"
@@ -1073,13 +1348,13 @@ class CSharpProjectManager:
                     "deployed_files": []
                 }
             
-            # Build file list from provided path
-            source_files = {}
-            for key, filename in [("dll", "O3DE.Core.dll"), 
-                                   ("deps", "O3DE.Core.deps.json")]:
-                file_path = source_dir / filename
-                if file_path.exists():
-                    source_files[key] = file_path
+            # Build file list from provided path (one scandir, no per-file stat)
+            present = self._list_dir_names(source_dir)
+            source_files = {
+                key: source_dir / filename
+                for key, filename in self._O3DE_CORE_FILE_KEYS
+                if filename in present
+            }
         else:
             source_files = self.find_o3de_core_source_files()
         
@@ -1127,10 +1402,10 @@ class CSharpProjectManager:
                     "deployed_files": deployed_files
                 }
         
-        # Check for missing optional files
-        expected_files = ["O3DE.Core.dll", "O3DE.Core.deps.json"]
-        for filename in expected_files:
-            if not (deploy_path / filename).exists():
+        # Check for missing optional files (single scandir of the deploy dir)
+        deployed_names = self._list_dir_names(deploy_path)
+        for _, filename in self._O3DE_CORE_FILE_KEYS:
+            if filename not in deployed_names:
                 missing_files.append(filename)
         
         message = f"Successfully deployed {len(deployed_files)} file(s) to {deploy_path}"
@@ -1152,29 +1427,21 @@ class CSharpProjectManager:
             Dict with 'deployed', 'path', and 'files' keys
         """
         deploy_path = self.get_o3de_core_deploy_path()
-        
+
         required_files = [
             "O3DE.Core.dll"
         ]
-        
+
         optional_files = [
             "O3DE.Core.deps.json"
         ]
-        
-        found_required = []
-        missing_required = []
-        found_optional = []
-        
-        for filename in required_files:
-            if (deploy_path / filename).exists():
-                found_required.append(filename)
-            else:
-                missing_required.append(filename)
-        
-        for filename in optional_files:
-            if (deploy_path / filename).exists():
-                found_optional.append(filename)
-        
+
+        # Single scandir instead of one exists() stat per file
+        present = self._list_dir_names(deploy_path)
+        found_required = [f for f in required_files if f in present]
+        missing_required = [f for f in required_files if f not in present]
+        found_optional = [f for f in optional_files if f in present]
+
         is_deployed = len(missing_required) == 0
         
         return {
@@ -1194,30 +1461,22 @@ class CSharpProjectManager:
             Dict with 'deployed', 'path', and 'files' keys
         """
         deploy_path = self.get_coral_deploy_path()
-        
+
         required_files = [
             "Coral.Managed.dll",
             "Coral.Managed.runtimeconfig.json"
         ]
-        
+
         optional_files = [
             "Coral.Managed.deps.json"
         ]
-        
-        found_required = []
-        missing_required = []
-        found_optional = []
-        
-        for filename in required_files:
-            if (deploy_path / filename).exists():
-                found_required.append(filename)
-            else:
-                missing_required.append(filename)
-        
-        for filename in optional_files:
-            if (deploy_path / filename).exists():
-                found_optional.append(filename)
-        
+
+        # Single scandir instead of one exists() stat per file
+        present = self._list_dir_names(deploy_path)
+        found_required = [f for f in required_files if f in present]
+        missing_required = [f for f in required_files if f not in present]
+        found_optional = [f for f in optional_files if f in present]
+
         is_deployed = len(missing_required) == 0
         
         return {
@@ -1266,21 +1525,27 @@ class CSharpProjectManager:
             project_dir.mkdir(parents=True, exist_ok=True)
             
             # Create .csproj file
-            csproj_content = CSPROJ_TEMPLATE.format(
+            csproj_content = _RENDER_CSPROJ(
                 o3de_core_path=self.o3de_core_path
             )
             csproj_path = project_dir / f"{project_name}.csproj"
-            csproj_path.write_text(csproj_content)
+            # write_bytes keeps the output byte-exact: text mode would pick
+            # the locale encoding and translate \n to \r\n on Windows,
+            # causing line-ending churn (and spurious rebuilds) between
+            # platforms.
+            csproj_path.write_bytes(csproj_content.encode("utf-8"))
             
-            # Create a default script
-            self.create_script(
+            # Create a default script. Skip the per-script metadata update:
+            # the metadata dict below already lists GameScript.cs, so
+            # project.json is written exactly once per project creation.
+            self._create_script_no_metadata_update(
                 project_dir,
                 "GameScript",
                 namespace,
                 "ScriptComponent",
                 "Default game script component"
             )
-            
+
             # Create project metadata
             metadata = {
                 "name": project_name,
@@ -1289,7 +1554,8 @@ class CSharpProjectManager:
                 "scripts": ["GameScript.cs"]
             }
             metadata_path = project_dir / "project.json"
-            metadata_path.write_text(json.dumps(metadata, indent=2))
+            self._write_project_metadata(metadata_path, metadata)
+            self._metadata_cache[str(metadata_path)] = metadata
 
             # Phase 17a: drop a .vscode/launch.json that points the managed
             # debugger at the editor process. F5 in VS Code = "Attach to
@@ -1300,11 +1566,13 @@ class CSharpProjectManager:
                 vscode_dir.mkdir(parents=True, exist_ok=True)
                 launch_path = vscode_dir / "launch.json"
                 if not launch_path.exists():
-                    launch_path.write_text(VSCODE_LAUNCH_JSON_TEMPLATE)
+                    launch_path.write_bytes(VSCODE_LAUNCH_JSON_TEMPLATE.encode("utf-8"))
             except OSError as e:
                 # Best-effort - csproj creation already succeeded.
                 print(f"[O3DESharp] could not write {project_dir}/.vscode/launch.json: {e}")
 
+            self._invalidate_projects_cache()
+
             return {
                 "success": True,
                 "message": f"Created C# project '{project_name}' at {project_dir}",
@@ -1338,61 +1606,110 @@ class CSharpProjectManager:
         Returns:
             Dict with 'success', 'message', and 'file_path' keys
         """
-        if template_type not in self.SCRIPT_TEMPLATES:
+        if not isinstance(project_path, Path):
+            project_path = Path(project_path)
+        result = self._create_script_no_metadata_update(
+            project_path, class_name, namespace, template_type, description
+        )
+        if result["success"]:
+            # Update project metadata
+            self._update_project_metadata(project_path, class_name)
+            self._invalidate_projects_cache()
+        return result
+
+    def _create_script_no_metadata_update(self,
+                                          project_path: Path,
+                                          class_name: str,
+                                          namespace: str,
+                                          template_type: str,
+                                          description: str) -> Dict[str, Any]:
+        """
+        Write the .cs file only, without touching project.json.
+
+        create_project uses this directly: it builds the metadata dict in
+        memory (scripts included) and writes project.json exactly once,
+        instead of create_script triggering a read+write that the final
+        metadata write would immediately clobber.
+        """
+        # Single dict lookup: .get instead of `in` + indexing.
+        template_info = self.SCRIPT_TEMPLATES.get(template_type)
+        if template_info is None:
             return {
                 "success": False,
                 "message": f"Unknown template type: {template_type}",
                 "file_path": None
             }
-        
-        template_info = self.SCRIPT_TEMPLATES[template_type]
-        
+
         try:
-            project_path = Path(project_path)
+            if not isinstance(project_path, Path):
+                project_path = Path(project_path)
             script_path = project_path / f"{class_name}.cs"
-            
+
             if script_path.exists():
                 return {
                     "success": False,
                     "message": f"Script already exists: {script_path}",
                     "file_path": None
                 }
-            
-            content = template_info['template'].format(
+
+            content = template_info['render'](
                 namespace=namespace,
                 class_name=class_name,
                 description=description or f"{class_name} class"
             )
-            
-            script_path.write_text(content)
-            
-            # Update project metadata
-            self._update_project_metadata(project_path, class_name)
-            
+
+            # Byte-exact UTF-8 write - see the csproj write in
+            # create_project for why text mode is avoided.
+            script_path.write_bytes(content.encode("utf-8"))
+
             return {
                 "success": True,
                 "message": f"Created script '{class_name}.cs'",
                 "file_path": str(script_path)
             }
-            
+
         except Exception as e:
             return {
                 "success": False,
                 "message": f"Failed to create script: {str(e)}",
                 "file_path": None
             }
-    
+
     def _update_project_metadata(self, project_path: Path, class_name: str):
-        """Update project.json with new script."""
+        """
+        Update project.json with new script.
+
+        The parsed dict is cached per project so batch script creation
+        only parses the file once. Writes stay eager (one per script) -
+        the editor process can die at any time and losing registered
+        scripts is worse than the extra write - but go through
+        _write_project_metadata so they're atomic.
+        """
         metadata_path = project_path / "project.json"
-        if metadata_path.exists():
-            metadata = json.loads(metadata_path.read_text())
-            if "scripts" not in metadata:
-                metadata["scripts"] = []
-            script_file = f"{class_name}.cs"
-            if script_file not in metadata["scripts"]:
-                metadata["scripts"].append(script_file)
-            metadata_path.write_text(json.dumps(metadata, indent=2))
+        cache_key = str(metadata_path)
+        metadata = self._metadata_cache.get(cache_key)
+        if metadata is None:
+            if not metadata_path.exists():
+                return
+            metadata = _json_loads(metadata_path.read_bytes())
+            self._metadata_cache[cache_key] = metadata
+        if "scripts" not in metadata:
+            metadata["scripts"] = []
+        script_file = f"{class_name}.cs"
+        if script_file not in metadata["scripts"]:
+            metadata["scripts"].append(script_file)
+        self._write_project_metadata(metadata_path, metadata)
+
+    @staticmethod
+    def _write_project_metadata(metadata_path: Path, metadata: dict):
+        """
+        Replace project.json atomically: write a sibling tempfile, then
+        os.replace it over the target. A crash mid-write can corrupt only
+        the tempfile, never the real metadata.
+        """
+        tmp_path = metadata_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps_indented(metadata))
+        os.replace(tmp_path, metadata_path)
     
     def build_project(self, project_path: Path, configuration: str = "Release") -> Dict[str, Any]:
         """
@@ -1427,6 +1744,29 @@ class CSharpProjectManager:
         
         csproj_path = csproj_files[0]
 
+        # Up-to-date check: if the output DLL is newer than every .cs source
+        # and the .csproj itself, there is nothing for MSBuild to do - skip
+        # the subprocess entirely. A handful of stat calls replaces seconds
+        # of MSBuild evaluation + compiler startup on no-op rebuilds.
+        dll_path = project_path / "bin" / configuration / (csproj_path.stem + ".dll")
+        deployed_path = self.project_path / "Bin" / "Scripts" / (csproj_path.stem + ".dll")
+        if dll_path.exists() and deployed_path.exists():
+            try:
+                newest_src = max(
+                    (p.stat().st_mtime_ns for p in project_path.rglob("*.cs")),
+                    default=0,
+                )
+                if dll_path.stat().st_mtime_ns > max(newest_src,
+                                                     csproj_path.stat().st_mtime_ns):
+                    return {
+                        "success": True,
+                        "message": "Build up to date",
+                        "output_path": str(deployed_path),
+                        "build_output": "",
+                    }
+            except OSError:
+                pass  # a file vanished mid-scan - fall through to a real build
+
         try:
             # Phase 16b: set the BuildInProgress flag so the editor's file watcher
             # (Phase 16a) coalesces every intermediate write during this build into
@@ -1440,12 +1780,47 @@ class CSharpProjectManager:
                 # timeout, a hung `dotnet build` (e.g. a stuck NuGet restore
                 # against an unreachable feed) blocks this call - and every
                 # caller of it - forever.
+                # --nologo / -v:q / NoSummary cut MSBuild's default chatter
+                # to errors+warnings, shrinking the captured stdout from
+                # hundreds of lines to a handful. The env opt-outs skip the
+                # dotnet CLI's first-run telemetry/logo probes.
+                # UseSharedCompilation routes compilation through the
+                # long-lived VBCSCompiler build server, so repeated builds
+                # skip Roslyn's per-process JIT/startup cost. It defaults
+                # on, but a user csproj or environment can switch it off -
+                # pin it here since this path is called repeatedly from
+                # the editor.
+                build_cmd = ["dotnet", "build", str(csproj_path), "-c", configuration,
+                             "--nologo", "-v:q", "-clp:NoSummary",
+                             "-p:UseSharedCompilation=true"]
+                # Skip the NuGet restore pass once this exact csproj
+                # revision has restored successfully this session - it's
+                # the slowest part of a no-op rebuild. The mtime in the
+                # key means an edited csproj (e.g. a new PackageReference)
+                # misses and restores again; matching on path alone would
+                # pin --no-restore to stale NuGet assets with no
+                # in-session recovery.
+                try:
+                    restore_key = (str(csproj_path), csproj_path.stat().st_mtime_ns)
+                except OSError:
+                    restore_key = None
+                if restore_key in self._restored:
+                    build_cmd.append("--no-restore")
+                # MSBUILDUSESERVER keeps a warm MSBuild server process
+                # across builds (skips MSBuild's own JIT/assembly-load tax);
+                # NUGET_XMLDOC_MODE=skip avoids extracting XML doc files
+                # from packages nobody reads during an editor build.
                 result = subprocess.run(
-                    ["dotnet", "build", str(csproj_path), "-c", configuration],
+                    build_cmd,
                     capture_output=True,
                     text=True,
                     cwd=str(project_path),
                     timeout=300,
+                    env={**os.environ,
+                         "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+                         "DOTNET_NOLOGO": "1",
+                         "MSBUILDUSESERVER": "1",
+                         "NUGET_XMLDOC_MODE": "skip"},
                 )
             except subprocess.TimeoutExpired as timeout_err:
                 return {
@@ -1460,6 +1835,11 @@ class CSharpProjectManager:
                 _set_build_in_progress(False)
 
             if result.returncode == 0:
+                # The restore (implicit or skipped) is known-good now, so
+                # subsequent builds of this csproj revision can pass
+                # --no-restore.
+                if restore_key is not None:
+                    self._restored.add(restore_key)
                 output_path = project_path / "bin" / configuration
                 dll_name = csproj_path.stem + ".dll"
                 dll_path = output_path / dll_name
@@ -1505,6 +1885,10 @@ class CSharpProjectManager:
                     "build_output": result.stdout
                 }
             else:
+                # Belt and braces: a failure with --no-restore may be the
+                # restore's fault even for this revision (e.g. deleted
+                # obj/), so the retry gets a full restore.
+                self._restored.discard(restore_key)
                 return {
                     "success": False,
                     "message": f"Build failed",
@@ -1543,9 +1927,7 @@ class CSharpProjectManager:
         for search_root in search_locations:
             if not search_root.exists():
                 continue
-            for csproj in search_root.rglob("*.csproj"):
-                if "bin" in csproj.parts or "obj" in csproj.parts:
-                    continue
+            for csproj in _iter_csproj_files(search_root):
                 if str(csproj) in seen:
                     continue
                 seen.add(str(csproj))
@@ -1580,10 +1962,9 @@ class CSharpProjectManager:
         for search_root in search_locations:
             if not search_root.exists():
                 continue
-            for csproj in search_root.rglob("*.csproj"):
-                # Skip build outputs and dedupe across the two roots.
-                if "bin" in csproj.parts or "obj" in csproj.parts:
-                    continue
+            for csproj in _iter_csproj_files(search_root):
+                # Build outputs are pruned by the walker; just dedupe
+                # across the two roots.
                 if str(csproj) in seen:
                     continue
                 seen.add(str(csproj))
@@ -1614,37 +1995,58 @@ class CSharpProjectManager:
 
         Searches for .csproj files within the project's Gem directory structure.
         """
-        projects = []
-        found_paths = set()  # Avoid duplicates
-        
         # Search locations: project's Gem directory and the default scripts path
         search_locations = [self.gem_path]
         if self.scripts_path != self.gem_path and self.scripts_path.exists():
             search_locations.append(self.scripts_path)
-        
+
+        # Serve from cache while the search roots are unchanged - editor UI
+        # code calls this repeatedly and nearly always gets identical results.
+        cache_key = tuple(
+            (str(p), p.stat().st_mtime_ns) for p in search_locations if p.exists()
+        )
+        if self._projects_cache is not None and cache_key == self._projects_cache_key:
+            return self._projects_cache
+
+        # Cold in-memory cache (fresh manager instance): try the persisted
+        # index before walking. Turns the common editor-startup case into a
+        # single small-file read.
+        persisted = self._load_projects_index(cache_key)
+        if persisted is not None:
+            self._projects_cache = persisted
+            self._projects_cache_key = cache_key
+            return persisted
+
+        projects = []
+        found_paths = set()  # Avoid duplicates
+
         for search_root in search_locations:
             if not search_root.exists():
                 continue
                 
-            # Recursively find all .csproj files
-            for csproj_file in search_root.rglob("*.csproj"):
+            # Prefer the git index when available; otherwise recursively
+            # find all .csproj files (build-output and hidden directories
+            # are pruned inside the walker).
+            csproj_files = _git_csproj_fast_path(search_root)
+            if csproj_files is None:
+                csproj_files = _iter_csproj_files(search_root)
+            for csproj_file in csproj_files:
                 project_dir = csproj_file.parent
-                
-                # Skip if we've already found this project
-                if str(project_dir) in found_paths:
-                    continue
-                found_paths.add(str(project_dir))
-                
-                # Skip build output directories
-                if "bin" in project_dir.parts or "obj" in project_dir.parts:
+
+                # Skip if we've already found this project. Materialize the
+                # dedup key once (os.fspath) instead of str()-ing the Path
+                # for the test and again for the add.
+                project_key = os.fspath(project_dir)
+                if project_key in found_paths:
                     continue
-                
+                found_paths.add(project_key)
+
                 # Load project metadata if available
                 metadata_path = project_dir / "project.json"
                 metadata = {}
                 if metadata_path.exists():
                     try:
-                        metadata = json.loads(metadata_path.read_text())
+                        metadata = _json_loads(metadata_path.read_bytes())
                     except:
                         pass
                 
@@ -1655,8 +2057,63 @@ class CSharpProjectManager:
                     "namespace": metadata.get("namespace", csproj_file.stem),
                     "scripts": metadata.get("scripts", [])
                 })
-        
+
+        self._projects_cache = projects
+        self._projects_cache_key = cache_key
+        self._save_projects_index(cache_key, projects)
+
         return projects
+
+    def _invalidate_projects_cache(self):
+        """Drop the cached list_projects result after a mutation."""
+        self._projects_cache = None
+        self._projects_cache_key = None
+        # The persisted index must go too: nested writes (e.g. updating a
+        # project.json) don't bump the search roots' mtimes, so its key
+        # would still match and resurrect the stale list on the next
+        # in-memory miss.
+        try:
+            self._projects_index_path().unlink()
+        except OSError:
+            pass
+
+    def _projects_index_path(self) -> Path:
+        """
+        Path of the persisted project index. Lives in <ProjectPath>/user/
+        alongside the build sentinel - survives the editor process, stays
+        out of source control.
+        """
+        return self.project_path / "user" / ".csharp_projects_index.json"
+
+    def _load_projects_index(self, cache_key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the persisted project list if its recorded search-root key
+        still matches *cache_key*. Returns None (walk required) on any
+        mismatch, missing file, or parse error - the index is purely an
+        accelerator and must never be trusted over the filesystem.
+        """
+        try:
+            data = _json_loads(self._projects_index_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        if data.get("key") != [list(entry) for entry in cache_key]:
+            return None
+        projects = data.get("projects")
+        return projects if isinstance(projects, list) else None
+
+    def _save_projects_index(self, cache_key: tuple, projects: List[Dict[str, Any]]):
+        """Best-effort write of the compact project index."""
+        index_path = self._projects_index_path()
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"key": [list(entry) for entry in cache_key], "projects": projects}
+            index_path.write_bytes(
+                json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            )
+        except OSError:
+            pass
     
     def list_scripts(self, project_path: Path) -> List[Dict[str, Any]]:
         """
@@ -1666,7 +2123,8 @@ class CSharpProjectManager:
         re-parsing files that haven't changed.
         """
         import time
-        project_path = Path(project_path)
+        if not isinstance(project_path, Path):
+            project_path = Path(project_path)
         project_key = str(project_path)
         
         # Check project-level cache
@@ -1696,15 +2154,18 @@ class CSharpProjectManager:
                 if cache_valid:
                     return cached_scripts
         
-        # Cache miss or invalid - rebuild
+        # Cache miss or invalid - rebuild. Cached entries are reused inline;
+        # files that actually need parsing get a placeholder slot so the
+        # original glob order is preserved after the parallel parse.
         scripts = []
+        to_parse = []  # (slot index in scripts, cs_file, mtime)
         for cs_file in project_path.glob("*.cs"):
             file_key = str(cs_file)
             try:
                 current_mtime = cs_file.stat().st_mtime
             except:
                 continue
-            
+
             # Check file-level cache
             if file_key in self._script_cache:
                 cached_mtime, cached_data = self._script_cache[file_key]
@@ -1712,36 +2173,27 @@ class CSharpProjectManager:
                     # File unchanged, use cached data
                     scripts.append(cached_data)
                     continue
-            
-            # Parse file (not in cache or modified)
-            try:
-                content = cs_file.read_text(encoding='utf-8', errors='ignore')
-                class_name = cs_file.stem
-                namespace = self._extract_namespace(content)
-                base_class = self._extract_base_class(content, class_name)
-                
-                script_data = {
-                    "file_name": cs_file.name,
-                    "class_name": class_name,
-                    "full_name": f"{namespace}.{class_name}" if namespace else class_name,
-                    "namespace": namespace,
-                    "base_class": base_class,
-                    "is_script_component": base_class == "ScriptComponent",
-                    "file_path": str(cs_file),  # Changed from 'path' to 'file_path' for consistency
-                    "path": str(cs_file)  # Keep for backward compatibility
-                }
-                
-                # Update file-level cache
-                self._script_cache[file_key] = (current_mtime, script_data)
-                scripts.append(script_data)
-                
-            except Exception as e:
-                print(f"[O3DESharp] Error parsing {cs_file.name}: {e}")
-                continue
-        
+
+            to_parse.append((len(scripts), cs_file, current_mtime))
+            scripts.append(None)
+
+        if to_parse:
+            # The per-file open/read/regex work is dominated by filesystem
+            # latency, so overlap the I/O waits across a thread pool. Cache
+            # writes stay on this thread - no shared mutable state inside
+            # the workers.
+            with ThreadPoolExecutor(max_workers=min(32, len(to_parse))) as executor:
+                parsed = list(executor.map(_parse_script_file,
+                                           (item[1] for item in to_parse)))
+            for (slot, cs_file, mtime), script_data in zip(to_parse, parsed):
+                if script_data is not None:
+                    self._script_cache[str(cs_file)] = (mtime, script_data)
+                scripts[slot] = script_data
+            scripts = [s for s in scripts if s is not None]
+
         # Update project-level cache
         self._project_scripts_cache[project_key] = (current_time, scripts)
-        
+
         return scripts
     
     def invalidate_cache(self, project_path: Path = None):
@@ -1771,15 +2223,12 @@ class CSharpProjectManager:
     
     def _extract_namespace(self, content: str) -> Optional[str]:
         """Extract namespace from C# file content."""
-        import re
-        match = re.search(r'namespace\s+([\w.]+)', content)
+        match = _NAMESPACE_RE.search(content)
         return match.group(1) if match else None
-    
+
     def _extract_base_class(self, content: str, class_name: str) -> Optional[str]:
         """Extract base class from C# file content."""
-        import re
-        pattern = rf'class\s+{class_name}\s*:\s*(\w+)'
-        match = re.search(pattern, content)
+        match = _base_class_re(class_name).search(content)
         return match.group(1) if match else None
     
     def get_available_script_classes(self) -> List[str]:
@@ -1846,6 +2295,18 @@ class CSharpProjectManager:
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_project_manager() -> CSharpProjectManager:
-    """Get the singleton project manager instance."""
+    """Get the singleton project manager instance.
+
+    Memoized: __init__ resolves project/engine paths and loads settings,
+    and editor commands fetch the manager once per invocation - reuse one
+    instance instead of repeating that work. Call invalidate() if the
+    active project changes under the editor.
+    """
     return CSharpProjectManager()
+
+
+def invalidate() -> None:
+    """Drop the cached manager so the next get_project_manager() rebuilds it."""
+    get_project_manager.cache_clear()
@@ -34,11 +34,13 @@ Usage:
 import argparse
 import logging
 import os
+import shutil
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add this directory to the path for local imports
 script_dir = Path(__file__).parent
@@ -52,11 +54,11 @@ _candidate = script_dir.parent.parent.parent.parent  # 4 levels up
 if (_candidate / "engine.json").exists():
     _SCRIPT_ENGINE_ROOT = _candidate
 
-from csharp_binding_generator import (
-    BindingGeneratorConfig,
-    BindingGeneratorResult,
-    ClangSharpInvoker,
-)
+# csharp_binding_generator is imported lazily inside the functions that
+# actually generate (annotations below are quoted for the same reason).
+# Info-only CLI invocations (--list-gems, --show-dependencies) only need
+# the resolver, and editor-side scripting calls them repeatedly, so they
+# should not pay the generator module's import cost on every run.
 from gem_dependency_resolver import GemDependencyResolver, GemResolutionResult
 
 # Set up logging
@@ -73,7 +75,7 @@ def generate_all_bindings(
     output_directory: str = None,
     force_regenerate: bool = False,
     engine_path: Optional[str] = None,
-) -> BindingGeneratorResult:
+) -> "BindingGeneratorResult":
     """
     Generate all C# bindings for a project.
 
@@ -86,6 +88,8 @@ def generate_all_bindings(
     Returns:
         BindingGeneratorResult with generation statistics
     """
+    from csharp_binding_generator import BindingGeneratorConfig
+
     config = BindingGeneratorConfig()
     if output_directory:
         config.output_directory = output_directory
@@ -102,19 +106,21 @@ def generate_gem_bindings(
     gem_names: List[str],
     output_directory: str = None,
     force_regenerate: bool = False
-) -> BindingGeneratorResult:
+) -> "BindingGeneratorResult":
     """
     Generate C# bindings for specific gems.
-    
+
     Args:
         project_path: Path to the O3DE project root
         gem_names: List of gem names to generate bindings for
         output_directory: Optional output directory
         force_regenerate: Bypass incremental build cache
-        
+
     Returns:
         BindingGeneratorResult with generation statistics
     """
+    from csharp_binding_generator import BindingGeneratorConfig
+
     config = BindingGeneratorConfig()
     config.include_gems = gem_names
     if output_directory:
@@ -130,18 +136,20 @@ def generate_core_bindings(
     project_path: str,
     output_directory: str = None,
     force_regenerate: bool = False
-) -> BindingGeneratorResult:
+) -> "BindingGeneratorResult":
     """
     Generate core O3DE bindings (no gems).
-    
+
     Args:
         project_path: Path to the O3DE project root
         output_directory: Optional output directory
         force_regenerate: Bypass incremental build cache
-        
+
     Returns:
         BindingGeneratorResult with generation statistics
     """
+    from csharp_binding_generator import BindingGeneratorConfig
+
     config = BindingGeneratorConfig()
     config.generate_core = True
     config.generate_gems = False
@@ -161,10 +169,10 @@ def generate_core_bindings(
 
 def generate_bindings_for_project(
     project_path: str,
-    config: Optional[BindingGeneratorConfig] = None,
+    config: Optional["BindingGeneratorConfig"] = None,
     force_regenerate: bool = False,
     engine_path: Optional[str] = None,
-) -> BindingGeneratorResult:
+) -> "BindingGeneratorResult":
     """
     Generate C# bindings for an O3DE project using the ClangSharp tool.
 
@@ -179,6 +187,12 @@ def generate_bindings_for_project(
     Returns:
         BindingGeneratorResult with generation statistics
     """
+    from csharp_binding_generator import (
+        BindingGeneratorConfig,
+        BindingGeneratorResult,
+        ClangSharpInvoker,
+    )
+
     logger.info(f"Generating C# bindings for project: {project_path}")
 
     # Create config with defaults if not provided
@@ -232,20 +246,22 @@ def generate_bindings_for_gems(
     project_path: str,
     gem_names: List[str],
     force_regenerate: bool = False,
-) -> BindingGeneratorResult:
+) -> "BindingGeneratorResult":
     """
     Generate C# bindings for specific gems only.
-    
+
     Args:
         project_path: Path to the O3DE project root
         gem_names: List of gem names to generate bindings for
         force_regenerate: If True, bypass incremental build cache
-        
+
     Returns:
         BindingGeneratorResult with generation statistics
     """
+    from csharp_binding_generator import BindingGeneratorConfig
+
     logger.info(f"Generating C# bindings for gems: {', '.join(gem_names)}")
-    
+
     # Create config for specific gems
     config = BindingGeneratorConfig()
     config.output_directory = str(Path(project_path) / "Generated" / "CSharp")
@@ -373,6 +389,34 @@ def find_binding_generator_tool() -> Optional[Path]:
     return None
 
 
+def _build_generated_csproj(csproj_path: Path) -> Tuple[str, bool]:
+    """
+    Run `dotnet build` on one generated .csproj.
+
+    Self-contained (one subprocess, thread-safe logging only) so the
+    --build-dlls path can fan these out across a thread pool.
+    """
+    # Gem name is the parent directory of the .csproj per the tool's
+    # output layout.
+    gem_name = csproj_path.parent.name
+    logger.info(f"Building {gem_name} from {csproj_path} ...")
+    try:
+        proc = subprocess.run(
+            ["dotnet", "build", str(csproj_path), "-c", "Release", "--nologo"],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except subprocess.TimeoutExpired:
+        logger.error(f"  {gem_name}: build timed out after 120 s")
+        return gem_name, False
+    if proc.returncode == 0:
+        logger.info(f"  {gem_name}: BUILD SUCCEEDED")
+        return gem_name, True
+    logger.error(f"  {gem_name}: BUILD FAILED\n{proc.stdout}\n{proc.stderr}")
+    return gem_name, False
+
+
 # ============================================================
 # CLI Interface
 # ============================================================
@@ -507,6 +551,8 @@ def main() -> int:
 
     # Handle info-only commands
     if args.check_tool:
+        from csharp_binding_generator import ClangSharpInvoker
+
         invoker = ClangSharpInvoker()
         available, message = invoker.check_tool_available()
         if available:
@@ -547,6 +593,8 @@ def main() -> int:
         return 1
 
     # Create configuration
+    from csharp_binding_generator import BindingGeneratorConfig
+
     config = BindingGeneratorConfig()
     config.root_namespace = args.namespace
     config.target_framework = args.target_framework
@@ -589,36 +637,27 @@ def main() -> int:
         csproj_files = list(gen_dir.rglob("*.csproj")) if gen_dir.exists() else []
         if not csproj_files:
             logger.warning("No .csproj files found in generation output - skipping DLL build.")
+        elif shutil.which("dotnet") is None:
+            # Checked once up front so the missing-SDK error is reported a
+            # single time instead of once per submitted build.
+            logger.error(
+                "dotnet CLI not found - cannot compile bindings. "
+                "Install the .NET SDK from https://dotnet.microsoft.com/download"
+            )
+            build_results = {p.parent.name: False for p in csproj_files}
         else:
             logger.info(f"Building {len(csproj_files)} generated .csproj into DLLs ...")
-            for csproj_path in csproj_files:
-                # Gem name is the parent directory of the .csproj per the
-                # tool's output layout.
-                gem_name = csproj_path.parent.name
-                logger.info(f"Building {gem_name} from {csproj_path} ...")
-                try:
-                    proc = subprocess.run(
-                        ["dotnet", "build", str(csproj_path), "-c", "Release", "--nologo"],
-                        capture_output=True,
-                        text=True,
-                        timeout=120,
-                    )
-                    if proc.returncode == 0:
-                        logger.info(f"  {gem_name}: BUILD SUCCEEDED")
-                        build_results[gem_name] = True
-                    else:
-                        logger.error(f"  {gem_name}: BUILD FAILED\n{proc.stdout}\n{proc.stderr}")
-                        build_results[gem_name] = False
-                except FileNotFoundError:
-                    logger.error(
-                        "dotnet CLI not found - cannot compile bindings. "
-                        "Install the .NET SDK from https://dotnet.microsoft.com/download"
-                    )
-                    build_results[gem_name] = False
-                    break
-                except subprocess.TimeoutExpired:
-                    logger.error(f"  {gem_name}: build timed out after 120 s")
-                    build_results[gem_name] = False
+            # The per-gem projects are independent and each build is one
+            # blocked subprocess, so threads overlap them fine; dotnet
+            # parallelizes internally, hence the conservative worker cap.
+            # Below 4 projects the pool costs more than it saves.
+            if len(csproj_files) >= 4:
+                workers = min(8, os.cpu_count() or 1, len(csproj_files))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(_build_generated_csproj, csproj_files)
+                    build_results = dict(results)
+            else:
+                build_results = dict(map(_build_generated_csproj, csproj_files))
 
     # Print summary
     print("\n" + "=" * 70)
@@ -59,6 +59,7 @@ class TestBuildProjectTimeout:
         manager.project_path = tmp_path
         manager.gem_path = tmp_path
         manager.scripts_path = tmp_path
+        manager._restored = set()
         return manager
 
     def test_build_times_out_returns_failure_dict(self, tmp_path):
@@ -109,6 +110,50 @@ class TestBuildProjectTimeout:
         _, kwargs = mock_run.call_args
         assert kwargs.get("timeout") == 300
 
+    def test_restore_skipped_only_for_unchanged_csproj(self, tmp_path):
+        """--no-restore applies to repeat builds of the same csproj
+        revision; editing the csproj (mtime bump) or a failed build must
+        fall back to a full restore."""
+        import os
+        project_dir = tmp_path / "MyGame"
+        project_dir.mkdir()
+        csproj = project_dir / "MyGame.csproj"
+        csproj.write_text("<Project />", encoding="utf-8")
+
+        manager = self._make_manager(tmp_path)
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+
+        with patch.object(manager, "ensure_runtime_deployed",
+                           return_value={"success": True, "message": "ok"}), \
+             patch("csharp_project_manager._set_build_in_progress"), \
+             patch("csharp_project_manager.subprocess.run",
+                   return_value=mock_result) as mock_run:
+            manager.build_project(project_dir, "Release")
+            manager.build_project(project_dir, "Release")
+
+            # Same revision: first build restores, second skips.
+            first_cmd, second_cmd = (c[0][0] for c in mock_run.call_args_list)
+            assert "--no-restore" not in first_cmd
+            assert "--no-restore" in second_cmd
+
+            # Edited csproj: new mtime misses the restore cache.
+            stat = csproj.stat()
+            os.utime(csproj, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            manager.build_project(project_dir, "Release")
+            assert "--no-restore" not in mock_run.call_args_list[2][0][0]
+
+            # Failed build drops the entry so the retry restores again.
+            mock_result.returncode = 1
+            manager.build_project(project_dir, "Release")  # skips, fails
+            assert "--no-restore" in mock_run.call_args_list[3][0][0]
+            mock_result.returncode = 0
+            manager.build_project(project_dir, "Release")
+            assert "--no-restore" not in mock_run.call_args_list[4][0][0]
+
     def test_build_in_progress_flag_cleared_on_timeout(self, tmp_path):
         """_set_build_in_progress(False) must still run (via `finally`)
         even when the build times out, so the file-watcher coalescing
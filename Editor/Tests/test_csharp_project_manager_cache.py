@@ -0,0 +1,123 @@
+#
+# Copyright (c) Contributors to the Open 3D Engine Project.
+# For complete copyright and license terms please see the LICENSE at the root of this distribution.
+#
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+#
+"""
+Unit tests for CSharpProjectManager's list_projects caching.
+
+Covers the in-memory cache, the persisted index in <ProjectPath>/user/,
+and - most importantly - the create_script invalidation path: a script
+write updates project.json inside a project directory without bumping
+the search root's mtime, so both cache layers must be dropped
+explicitly or a later list_projects returns stale data.
+"""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+def _install_azlmbr_stub():
+    """
+    csharp_project_manager.py imports azlmbr.* at module scope; none of
+    those packages exist outside a running O3DE Editor process, so stub
+    them in sys.modules before the module under test is imported.
+    """
+    azlmbr = types.ModuleType("azlmbr")
+    azlmbr_bus = types.ModuleType("azlmbr.bus")
+    azlmbr_editor = types.ModuleType("azlmbr.editor")
+    azlmbr_paths = types.ModuleType("azlmbr.paths")
+    azlmbr_paths.projectroot = str(Path(__file__).resolve().parents[2])
+    azlmbr.bus = azlmbr_bus
+    azlmbr.editor = azlmbr_editor
+    azlmbr.paths = azlmbr_paths
+    sys.modules["azlmbr"] = azlmbr
+    sys.modules["azlmbr.bus"] = azlmbr_bus
+    sys.modules["azlmbr.editor"] = azlmbr_editor
+    sys.modules["azlmbr.paths"] = azlmbr_paths
+
+
+_install_azlmbr_stub()
+
+from csharp_project_manager import CSharpProjectManager  # noqa: E402
+
+
+@pytest.mark.unit
+class TestListProjectsCache:
+    """Test suite for list_projects caching and explicit invalidation."""
+
+    def _make_manager(self, tmp_path):
+        manager = CSharpProjectManager.__new__(CSharpProjectManager)
+        manager.project_path = tmp_path
+        manager.gem_path = tmp_path / "Scripts"
+        manager.scripts_path = manager.gem_path
+        manager._projects_cache = None
+        manager._projects_cache_key = None
+        manager._metadata_cache = {}
+        return manager
+
+    def _make_project(self, tmp_path, name="MyGame"):
+        project_dir = tmp_path / "Scripts" / name
+        project_dir.mkdir(parents=True)
+        (project_dir / f"{name}.csproj").write_text(
+            "<Project />", encoding="utf-8"
+        )
+        (project_dir / "project.json").write_text(
+            json.dumps({"namespace": name, "scripts": []}), encoding="utf-8"
+        )
+        return project_dir
+
+    def test_list_projects_finds_project(self, tmp_path):
+        """The walk discovers a project and its metadata."""
+        self._make_project(tmp_path)
+        manager = self._make_manager(tmp_path)
+
+        projects = manager.list_projects()
+
+        assert [p["name"] for p in projects] == ["MyGame"]
+        assert projects[0]["scripts"] == []
+
+    def test_create_script_invalidates_memory_cache(self, tmp_path):
+        """A script created after list_projects must show up on the next
+        call even though the search root's mtime is unchanged."""
+        project_dir = self._make_project(tmp_path)
+        manager = self._make_manager(tmp_path)
+        manager.list_projects()
+
+        result = manager.create_script(project_dir, "NewScript", "MyGame")
+
+        assert result["success"], result["message"]
+        projects = manager.list_projects()
+        assert "NewScript.cs" in projects[0]["scripts"]
+
+    def test_create_script_invalidates_persisted_index(self, tmp_path):
+        """The on-disk index must not survive a mutation: a fresh manager
+        (new editor session) would match its key - nested writes don't
+        bump the root mtime - and resurrect the stale project list."""
+        project_dir = self._make_project(tmp_path)
+        manager = self._make_manager(tmp_path)
+        manager.list_projects()
+        assert manager._projects_index_path().exists()
+
+        result = manager.create_script(project_dir, "NewScript", "MyGame")
+
+        assert result["success"], result["message"]
+        assert not manager._projects_index_path().exists()
+        fresh = self._make_manager(tmp_path)
+        projects = fresh.list_projects()
+        assert "NewScript.cs" in projects[0]["scripts"]
+
+    def test_persisted_index_serves_fresh_manager(self, tmp_path):
+        """Without any mutation the persisted index is a valid shortcut
+        for a cold manager."""
+        self._make_project(tmp_path)
+        manager = self._make_manager(tmp_path)
+        expected = manager.list_projects()
+
+        fresh = self._make_manager(tmp_path)
+        assert fresh.list_projects() == expected
@@ -13,7 +13,11 @@ Tests gem discovery and dependency graph resolution using real gem.json files.
 import pytest
 from pathlib import Path
 
-from gem_dependency_resolver import GemDependencyResolver, GemDescriptor
+from gem_dependency_resolver import (
+    GemDependencyResolver,
+    GemDescriptor,
+    get_gem_dependency_order,
+)
 
 
 @pytest.mark.unit
@@ -81,6 +85,81 @@ class TestGemDependencyResolverIntegration:
             assert gem_json.exists(), f"Gem {gem_name} missing gem.json at {gem_path}"
 
 
+@pytest.mark.unit
+class TestDependencyOrdering:
+    """Test suite for the topological sort and its cycle reporting."""
+
+    @staticmethod
+    def _make_resolver(spec):
+        """Build a resolver from {name: [dependency, ...]}."""
+        resolver = GemDependencyResolver()
+        for name, deps in spec.items():
+            resolver.register_gem(GemDescriptor(name=name, dependencies=deps))
+        return resolver
+
+    def test_order_or_cycle_acyclic(self):
+        """An acyclic graph yields (order, None) with deps before dependents."""
+        resolver = self._make_resolver({"A": ["B"], "B": ["C"], "C": []})
+        order, cycle = resolver.get_gems_in_dependency_order_or_cycle()
+
+        assert cycle is None
+        assert order.index("C") < order.index("B") < order.index("A")
+
+    def test_order_or_cycle_reports_closed_path(self):
+        """A cyclic graph yields (None, cycle) where the cycle is a closed
+        path of real dependency edges."""
+        resolver = self._make_resolver(
+            {"Clean": [], "A": ["B"], "B": ["C"], "C": ["A"]}
+        )
+        order, cycle = resolver.get_gems_in_dependency_order_or_cycle()
+
+        assert order is None
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {"A", "B", "C"}
+        for upstream, downstream in zip(cycle, cycle[1:]):
+            assert downstream in resolver.get_gem(upstream).dependencies
+
+    def test_order_or_cycle_self_dependency(self):
+        """A gem depending on itself is the smallest possible cycle."""
+        resolver = self._make_resolver({"X": ["X"]})
+        order, cycle = resolver.get_gems_in_dependency_order_or_cycle()
+
+        assert order is None
+        assert cycle == ["X", "X"]
+
+    def test_legacy_order_still_appends_cyclic_remainder(self):
+        """get_gems_in_dependency_order keeps its warn-and-append behavior."""
+        resolver = self._make_resolver({"X": ["X"], "Y": []})
+        order = resolver.get_gems_in_dependency_order()
+
+        assert sorted(order) == ["X", "Y"]
+
+    def test_isolated_gems_emitted_first(self):
+        """Gems with no dependencies and no dependents lead the order."""
+        gems = {
+            name: GemDescriptor(name=name, dependencies=deps)
+            for name, deps in [
+                ("A", ["B"]), ("B", []), ("Lone1", []), ("Lone2", []),
+            ]
+        }
+        order = get_gem_dependency_order(gems)
+
+        assert order[:2] == ["Lone1", "Lone2"]
+        assert order.index("B") < order.index("A")
+
+    def test_unspecified_traversal_is_still_a_valid_order(self):
+        """traversal_order='unspecified' skips the partitioning but must
+        still emit dependencies before dependents."""
+        gems = {
+            name: GemDescriptor(name=name, dependencies=deps)
+            for name, deps in [("A", ["B"]), ("B", []), ("Lone", [])]
+        }
+        order = get_gem_dependency_order(gems, traversal_order="unspecified")
+
+        assert sorted(order) == ["A", "B", "Lone"]
+        assert order.index("B") < order.index("A")
+
+
 @pytest.mark.unit
 class TestGemDescriptor:
     """Test suite for GemDescriptor class."""